@@ -1,7 +1,69 @@
+import calendar
+from datetime import date, timedelta
+
 from django.contrib import admin
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ChangeList
 from .models import Category, Expense, Income, UserProfile
 
 
+class DateRangeChangeList(ChangeList):
+    """ChangeList that rewrites date_hierarchy drill-down params into
+    half-open range lookups (date >= start AND date < end) so the
+    (user, date) index is used instead of EXTRACT-style predicates.
+
+    Also restricts the list query to the columns list_display renders,
+    leaving wide columns (description, timestamps) unfetched."""
+
+    # Shared by Expense and Income, whose list_display is identical.
+    list_only_fields = (
+        'title', 'amount', 'date',
+        'category__name', 'category__color_rgb',
+        'user__username',
+    )
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        year = lookup_params.pop('date__year', None)
+        month = lookup_params.pop('date__month', None)
+        day = lookup_params.pop('date__day', None)
+        self.date_range = self._build_date_range(year, month, day)
+        return lookup_params
+
+    @staticmethod
+    def _build_date_range(year, month, day):
+        """Return (start, end) covering the drilled-down period, or None.
+
+        Malformed params raise IncorrectLookupParameters so
+        changelist_view falls back to its usual ?e=1 redirect, matching
+        how stock date_hierarchy lookups fail.
+        """
+        if year is None:
+            return None
+        try:
+            # Params come from request.GET.lists(), so each value is a list.
+            year = int(year[0] if isinstance(year, list) else year)
+            if month is None:
+                return date(year, 1, 1), date(year + 1, 1, 1)
+            month = int(month[0] if isinstance(month, list) else month)
+            if day is None:
+                start = date(year, month, 1)
+                end = start + timedelta(days=calendar.monthrange(year, month)[1])
+                return start, end
+            day = int(day[0] if isinstance(day, list) else day)
+            start = date(year, month, day)
+            return start, start + timedelta(days=1)
+        except (ValueError, OverflowError) as e:
+            raise IncorrectLookupParameters(e)
+
+    def get_queryset(self, request, exclude_parameters=None):
+        qs = super().get_queryset(request, exclude_parameters)
+        if self.date_range:
+            start, end = self.date_range
+            qs = qs.filter(date__gte=start, date__lt=end)
+        return qs.only(*self.list_only_fields)
+
+
 @admin.register(UserProfile)
 class UserProfileAdmin(admin.ModelAdmin):
     list_display = ['user', 'currency', 'dark_mode', 'created_at']
@@ -11,20 +73,31 @@ class UserProfileAdmin(admin.ModelAdmin):
 class CategoryAdmin(admin.ModelAdmin):
     list_display = ['name', 'category_type', 'user', 'is_default', 'color']
     list_filter = ['category_type', 'is_default']
+    list_select_related = ['user']
     search_fields = ['name', 'user__username']
 
 
 @admin.register(Expense)
 class ExpenseAdmin(admin.ModelAdmin):
     list_display = ['title', 'amount', 'category', 'date', 'user']
-    list_filter = ['category', 'date']
+    list_filter = [('category', admin.RelatedOnlyFieldListFilter), ('date', admin.DateFieldListFilter)]
+    list_select_related = ['category', 'user']
+    autocomplete_fields = ['category', 'user']
     search_fields = ['title', 'user__username']
     date_hierarchy = 'date'
 
+    def get_changelist(self, request, **kwargs):
+        return DateRangeChangeList
+
 
 @admin.register(Income)
 class IncomeAdmin(admin.ModelAdmin):
     list_display = ['title', 'amount', 'category', 'date', 'user']
-    list_filter = ['category', 'date']
+    list_filter = [('category', admin.RelatedOnlyFieldListFilter), ('date', admin.DateFieldListFilter)]
+    list_select_related = ['category', 'user']
+    autocomplete_fields = ['category', 'user']
     search_fields = ['title', 'user__username']
     date_hierarchy = 'date'
+
+    def get_changelist(self, request, **kwargs):
+        return DateRangeChangeList
@@ -1,23 +1,52 @@
 """
 Context processors to inject global template variables.
 """
+from django.core.cache import cache
+
 from .models import UserProfile
 
+THEME_CACHE_TIMEOUT = 300  # seconds
+
+_DEFAULT_THEME = {
+    'dark_mode': False,
+    'user_currency': '$',
+}
+
+
+def theme_cache_key(user_id):
+    return f'profile:{user_id}'
+
 
 def theme_context(request):
-    """Inject dark_mode and currency into every template."""
-    dark_mode = False
-    currency = '$'
+    """Inject dark_mode and currency into every template.
+
+    The lookup is memoized on the request (so repeated renders within one
+    request never re-query) and cached across requests for a short TTL;
+    the cache key is busted by the UserProfile post_save/post_delete
+    signals in models.py.
+    """
+    if hasattr(request, '_theme_context'):
+        return request._theme_context
 
     if request.user.is_authenticated:
-        try:
-            profile = request.user.profile
-            dark_mode = profile.dark_mode
-            currency = profile.currency
-        except UserProfile.DoesNotExist:
-            pass
-
-    return {
-        'dark_mode': dark_mode,
-        'user_currency': currency,
-    }
+        user_id = request.user.pk
+
+        def fetch():
+            # ProfileAttachMiddleware may have primed the relation already.
+            profile = request.user._state.fields_cache.get('profile')
+            if profile is None:
+                try:
+                    profile = UserProfile.objects.only('dark_mode', 'currency').get(user_id=user_id)
+                except UserProfile.DoesNotExist:
+                    return dict(_DEFAULT_THEME)
+            return {
+                'dark_mode': profile.dark_mode,
+                'user_currency': profile.currency,
+            }
+
+        context = cache.get_or_set(theme_cache_key(user_id), fetch, THEME_CACHE_TIMEOUT)
+    else:
+        context = dict(_DEFAULT_THEME)
+
+    request._theme_context = context
+    return context
@@ -3,15 +3,86 @@ Finance Tracker Forms
 =====================
 ModelForms for all models with Bootstrap 5 styling and validation.
 """
+import copy
+from datetime import timedelta
+
 from django import forms
 from django.contrib.auth.models import User
 from django.contrib.auth.forms import UserCreationForm, AuthenticationForm
+from django.core.cache import cache
+from django.core.validators import RegexValidator
+from django.db.models.functions import Lower
 from .models import Category, Expense, Income, UserProfile
 from django.core.exceptions import ValidationError
 
 
+# ─── Category Caching ─────────────────────────────────────────────────────────
+
+CATEGORY_CACHE_TIMEOUT = 600  # seconds
+
+# Which category_type values each form kind accepts.
+CATEGORY_KINDS = {
+    'expense': ('expense', 'both'),
+    'income': ('income', 'both'),
+    'all': ('expense', 'income', 'both'),
+}
+
+
+def category_cache_key(user_id):
+    return f'catidx:{user_id}'
+
+
+def user_category_ids(user):
+    """Return the user's category ids grouped by category_type.
+
+    One cache entry ({'expense': [...], 'income': [...], 'both': [...]})
+    serves every form kind, so all selects on a page share a single cache
+    hit. Category post_save/post_delete signals bust the key.
+    """
+    def build():
+        index = {'expense': [], 'income': [], 'both': []}
+        rows = Category.objects.filter(user=user).values_list('id', 'category_type')
+        for pk, category_type in rows:
+            index[category_type].append(pk)
+        return index
+
+    return cache.get_or_set(category_cache_key(user.pk), build, CATEGORY_CACHE_TIMEOUT)
+
+
+def get_user_categories(user, kind='all'):
+    """Return a queryset of the user's categories usable for `kind`.
+
+    Categories change rarely, so the id index is cached per user; the
+    returned queryset then resolves via a primary-key probe instead of
+    re-running the type filter on every form render.
+    """
+    index = user_category_ids(user)
+    ids = [pk for category_type in CATEGORY_KINDS[kind] for pk in index[category_type]]
+    return Category.objects.filter(pk__in=ids)
+
+
 # ─── Auth Forms ───────────────────────────────────────────────────────────────
 
+def bootstrapify(form_cls, placeholders=False):
+    """Apply Bootstrap widget classes once at class-definition time.
+
+    Replaces the per-instance `for field in self.fields.values()` loops:
+    the attrs are baked into the class's base_fields so every
+    instantiation just deep-copies ready-styled fields. Inherited fields
+    are copied before mutation so parent forms (e.g. the admin's
+    UserCreationForm) are not affected.
+    """
+    for name, field in form_cls.base_fields.items():
+        field = copy.deepcopy(field)
+        field.widget.attrs['class'] = 'form-control'
+        if placeholders:
+            field.widget.attrs['placeholder'] = field.label or name.replace('_', ' ').capitalize()
+        form_cls.base_fields[name] = field
+        if name in form_cls.declared_fields:
+            form_cls.declared_fields[name] = field
+    return form_cls
+
+
 class UserRegisterForm(UserCreationForm):
     """Extended registration form with email field."""
     email = forms.EmailField(required=True)
@@ -22,25 +93,32 @@ class UserRegisterForm(UserCreationForm):
         model = User
         fields = ['username', 'first_name', 'last_name', 'email', 'password1', 'password2']
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        for field in self.fields.values():
-            field.widget.attrs['class'] = 'form-control'
-            field.widget.attrs['placeholder'] = field.label
-
     def clean_email(self):
-        email = self.cleaned_data.get('email')
-        if User.objects.filter(email=email).exists():
+        # Store normalized so case variants can't create duplicate accounts.
+        email = self.cleaned_data.get('email', '').strip().lower()
+        # Case-insensitive so the LOWER(email) unique index is used; the
+        # index itself is the authoritative race-free check at save time.
+        if User.objects.filter(email__iexact=email).exists():
             raise ValidationError("An account with this email already exists.")
         return email
 
+    @classmethod
+    def validate_many(cls, emails):
+        """Return the subset of `emails` already registered, in one query.
+
+        Batch counterpart to clean_email for contexts validating several
+        registrations at once — one SELECT regardless of form count.
+        """
+        normalized = {email.strip().lower() for email in emails}
+        return set(
+            User.objects.annotate(email_lower=Lower('email'))
+            .filter(email_lower__in=normalized)
+            .values_list('email_lower', flat=True)
+        )
+
 
 class UserLoginForm(AuthenticationForm):
     """Styled login form."""
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        for field in self.fields.values():
-            field.widget.attrs['class'] = 'form-control'
 
 
 class UserUpdateForm(forms.ModelForm):
@@ -51,10 +129,10 @@ class UserUpdateForm(forms.ModelForm):
         model = User
         fields = ['first_name', 'last_name', 'email']
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        for field in self.fields.values():
-            field.widget.attrs['class'] = 'form-control'
+
+bootstrapify(UserRegisterForm, placeholders=True)
+bootstrapify(UserLoginForm)
+bootstrapify(UserUpdateForm)
 
 
 class ProfileUpdateForm(forms.ModelForm):
@@ -72,24 +150,53 @@ class ProfileUpdateForm(forms.ModelForm):
 
 class CategoryForm(forms.ModelForm):
     """Category create/edit form."""
+    # Declared field: color is stored as an integer (color_rgb) on the
+    # model, so the hex value from the picker goes through the property.
+    # The validator keeps hand-crafted POSTs from reaching the int()
+    # parse in the property setter.
+    color = forms.CharField(
+        initial='#6c757d',
+        validators=[RegexValidator(r'^#[0-9a-fA-F]{6}$', 'Enter a color as #rrggbb.')],
+        widget=forms.TextInput(attrs={'class': 'form-control form-control-color', 'type': 'color'})
+    )
+
     class Meta:
         model = Category
-        fields = ['name', 'category_type', 'icon', 'color']
+        fields = ['name', 'category_type', 'icon']
         widgets = {
             'name': forms.TextInput(attrs={'class': 'form-control', 'placeholder': 'Category name'}),
             'category_type': forms.Select(attrs={'class': 'form-select'}),
             'icon': forms.TextInput(attrs={'class': 'form-control', 'placeholder': 'e.g. bi-cart'}),
-            'color': forms.TextInput(attrs={'class': 'form-control form-control-color', 'type': 'color'}),
         }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.instance.pk:
+            self.fields['color'].initial = self.instance.color
+
+    def save(self, commit=True):
+        self.instance.color = self.cleaned_data['color']
+        return super().save(commit)
+
 
 # ─── Expense Forms ────────────────────────────────────────────────────────────
 
 class ExpenseForm(forms.ModelForm):
     """Expense create/edit form with user-filtered categories."""
+    # Which get_user_categories kind populates the category select.
+    category_kind = 'expense'
+
     date = forms.DateField(
         widget=forms.DateInput(attrs={'class': 'form-control', 'type': 'date'})
     )
+    # Declared so required/empty_label/widget are baked in at class time
+    # instead of mutated per instance; __init__ only swaps the queryset.
+    category = forms.ModelChoiceField(
+        queryset=Category.objects.none(),
+        required=False,
+        empty_label='-- Select Category --',
+        widget=forms.Select(attrs={'class': 'form-select'})
+    )
 
     class Meta:
         model = Expense
@@ -97,7 +204,6 @@ class ExpenseForm(forms.ModelForm):
         widgets = {
             'title': forms.TextInput(attrs={'class': 'form-control', 'placeholder': 'Expense title'}),
             'amount': forms.NumberInput(attrs={'class': 'form-control', 'placeholder': '0.00', 'step': '0.01', 'min': '0'}),
-            'category': forms.Select(attrs={'class': 'form-select'}),
             'description': forms.Textarea(attrs={'class': 'form-control', 'rows': 3, 'placeholder': 'Optional description'}),
         }
 
@@ -105,12 +211,7 @@ class ExpenseForm(forms.ModelForm):
         self.user = kwargs.pop('user', None)
         super().__init__(*args, **kwargs)
         if self.user:
-            self.fields['category'].queryset = Category.objects.filter(
-                user=self.user,
-                category_type__in=['expense', 'both']
-            )
-        self.fields['category'].required = False
-        self.fields['category'].empty_label = '-- Select Category --'
+            self.fields['category'].queryset = get_user_categories(self.user, self.category_kind)
 
     def clean_amount(self):
         amount = self.cleaned_data.get('amount')
@@ -119,32 +220,17 @@ class ExpenseForm(forms.ModelForm):
         return amount
 
 
-class IncomeForm(forms.ModelForm):
-    """Income create/edit form."""
-    date = forms.DateField(
-        widget=forms.DateInput(attrs={'class': 'form-control', 'type': 'date'})
-    )
+class IncomeForm(ExpenseForm):
+    """Income create/edit form. Shares ExpenseForm's field styling and
+    category handling, but targets Income and income-type categories."""
+    category_kind = 'income'
 
-    class Meta:
+    class Meta(ExpenseForm.Meta):
         model = Income
-        fields = ['title', 'amount', 'category', 'date', 'description']
-        widgets = {
-            'title': forms.TextInput(attrs={'class': 'form-control', 'placeholder': 'Income title'}),
-            'amount': forms.NumberInput(attrs={'class': 'form-control', 'placeholder': '0.00', 'step': '0.01', 'min': '0'}),
-            'category': forms.Select(attrs={'class': 'form-select'}),
-            'description': forms.Textarea(attrs={'class': 'form-control', 'rows': 3, 'placeholder': 'Optional description'}),
-        }
-
-    def __init__(self, *args, **kwargs):
-        self.user = kwargs.pop('user', None)
-        super().__init__(*args, **kwargs)
-        if self.user:
-            self.fields['category'].queryset = Category.objects.filter(
-                user=self.user,
-                category_type__in=['income', 'both']
-            )
-        self.fields['category'].required = False
-        self.fields['category'].empty_label = '-- Select Category --'
+        widgets = dict(
+            ExpenseForm.Meta.widgets,
+            title=forms.TextInput(attrs={'class': 'form-control', 'placeholder': 'Income title'}),
+        )
 
     def clean_amount(self):
         amount = self.cleaned_data.get('amount')
@@ -155,7 +241,26 @@ class IncomeForm(forms.ModelForm):
 
 # ─── Filter Forms ─────────────────────────────────────────────────────────────
 
-class ExpenseFilterForm(forms.Form):
+class DateRangeMixin:
+    """Turn date_from/date_to into index-friendly range lookups.
+
+    clean() populates `self.filters` with plain `date__gte`/`date__lt`
+    predicates (half-open upper bound) so the (user, date) B-tree index is
+    usable; views must not re-wrap the values in `__date`/`__year`-style
+    extract lookups.
+    """
+
+    def clean(self):
+        cleaned = super().clean()
+        self.filters = {}
+        if cleaned.get('date_from'):
+            self.filters['date__gte'] = cleaned['date_from']
+        if cleaned.get('date_to'):
+            self.filters['date__lt'] = cleaned['date_to'] + timedelta(days=1)
+        return cleaned
+
+
+class ExpenseFilterForm(DateRangeMixin, forms.Form):
     """Search and filter form for expense list."""
     search = forms.CharField(
         required=False,
@@ -188,10 +293,10 @@ class ExpenseFilterForm(forms.Form):
         user = kwargs.pop('user', None)
         super().__init__(*args, **kwargs)
         if user:
-            self.fields['category'].queryset = Category.objects.filter(user=user)
+            self.fields['category'].queryset = get_user_categories(user, 'all')
 
 
-class DateRangeFilterForm(forms.Form):
+class DateRangeFilterForm(DateRangeMixin, forms.Form):
     """Simple date range for dashboard."""
     date_from = forms.DateField(
         required=False,
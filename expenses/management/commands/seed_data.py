@@ -8,7 +8,7 @@ from django.contrib.auth.models import User
 from django.utils import timezone
 from datetime import date, timedelta
 import random
-from expenses.models import Category, Expense, Income, UserProfile
+from expenses.models import Category, Expense, Income
 from expenses.views import create_default_categories
 
 
@@ -28,14 +28,14 @@ class Command(BaseCommand):
         if created:
             user.set_password('Demo@1234')
             user.save()
-            UserProfile.objects.create(user=user)
+            # Profile creation is handled by the post_save(User) signal.
             create_default_categories(user)
             self.stdout.write(self.style.SUCCESS('Demo user created: demo / Demo@1234'))
         else:
             self.stdout.write('Demo user already exists.')
 
-        # Sample expenses
-        categories = Category.objects.filter(user=user, category_type='expense')
+        # Sample expenses (materialize categories once, insert in one batch)
+        categories = list(Category.objects.filter(user=user, category_type='expense'))
         expense_data = [
             ('Grocery shopping', 85.50),
             ('Netflix subscription', 15.99),
@@ -49,39 +49,55 @@ class Command(BaseCommand):
             ('Books', 28.00),
         ]
 
-        for i, (title, amount) in enumerate(expense_data):
-            d = date.today() - timedelta(days=random.randint(0, 60))
-            Expense.objects.get_or_create(
-                user=user,
-                title=title,
-                defaults={
-                    'amount': amount,
-                    'category': categories[i % categories.count()] if categories.exists() else None,
-                    'date': d,
-                    'description': f'Sample expense: {title}',
-                }
-            )
+        existing_titles = set(
+            Expense.objects.filter(
+                user=user, title__in=[title for title, _ in expense_data]
+            ).values_list('title', flat=True)
+        )
+        Expense.objects.bulk_create(
+            [
+                Expense(
+                    user=user,
+                    title=title,
+                    amount=amount,
+                    category=categories[i % len(categories)] if categories else None,
+                    date=date.today() - timedelta(days=random.randint(0, 60)),
+                    description=f'Sample expense: {title}',
+                )
+                for i, (title, amount) in enumerate(expense_data)
+                if title not in existing_titles
+            ],
+            ignore_conflicts=True,
+        )
 
         # Sample income
-        income_categories = Category.objects.filter(user=user, category_type='income')
+        income_categories = list(Category.objects.filter(user=user, category_type='income'))
         income_data = [
             ('Monthly Salary', 3500.00),
             ('Freelance Project', 800.00),
             ('Investment Dividend', 150.00),
             ('Bonus', 500.00),
         ]
-        for i, (title, amount) in enumerate(income_data):
-            d = date.today() - timedelta(days=random.randint(0, 30))
-            Income.objects.get_or_create(
-                user=user,
-                title=title,
-                defaults={
-                    'amount': amount,
-                    'category': income_categories[i % income_categories.count()] if income_categories.exists() else None,
-                    'date': d,
-                    'description': f'Sample income: {title}',
-                }
-            )
+        existing_titles = set(
+            Income.objects.filter(
+                user=user, title__in=[title for title, _ in income_data]
+            ).values_list('title', flat=True)
+        )
+        Income.objects.bulk_create(
+            [
+                Income(
+                    user=user,
+                    title=title,
+                    amount=amount,
+                    category=income_categories[i % len(income_categories)] if income_categories else None,
+                    date=date.today() - timedelta(days=random.randint(0, 30)),
+                    description=f'Sample income: {title}',
+                )
+                for i, (title, amount) in enumerate(income_data)
+                if title not in existing_titles
+            ],
+            ignore_conflicts=True,
+        )
 
         self.stdout.write(self.style.SUCCESS('✅ Sample data seeded successfully!'))
         self.stdout.write('Login with: demo / Demo@1234')
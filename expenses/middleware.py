@@ -0,0 +1,60 @@
+"""
+Middleware for request-scoped profile loading.
+"""
+from django.contrib import auth
+from django.utils.functional import SimpleLazyObject
+
+from .models import UserProfile
+
+
+def get_user_with_profile(request):
+    """Resolve the session user and prime their profile in one pass.
+
+    Runs the normal lazy auth lookup, then fetches the UserProfile and
+    stores it in the user's relation cache, so request.user.profile is
+    free for the context processor and every downstream view instead of
+    each issuing its own SELECT.
+    """
+    user = auth.get_user(request)
+    if user.is_authenticated and 'profile' not in user._state.fields_cache:
+        try:
+            profile = UserProfile.objects.get(user_id=user.pk)
+        except UserProfile.DoesNotExist:
+            pass
+        else:
+            profile.user = user
+            user._state.fields_cache['profile'] = profile
+    return user
+
+
+def get_request_profile(request):
+    """Return the request user's profile, or None for anonymous users.
+
+    Reuses the profile primed by get_user_with_profile when present and
+    falls back to get_or_create for accounts predating the auto-create
+    signal, caching the result on the user either way.
+    """
+    user = request.user
+    if not user.is_authenticated:
+        return None
+    profile = user._state.fields_cache.get('profile')
+    if profile is None:
+        profile, _ = UserProfile.objects.get_or_create(user=user)
+        user._state.fields_cache['profile'] = profile
+    return profile
+
+
+class ProfileAttachMiddleware:
+    """Rewrap request.user so its first access also attaches the profile,
+    and expose it as request.profile for views.
+
+    Must be installed after AuthenticationMiddleware.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.user = SimpleLazyObject(lambda: get_user_with_profile(request))
+        request.profile = SimpleLazyObject(lambda: get_request_profile(request))
+        return self.get_response(request)
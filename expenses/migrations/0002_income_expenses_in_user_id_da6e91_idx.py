@@ -0,0 +1,19 @@
+# Generated by Django 5.0.6 on 2026-08-30 06:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('expenses', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='income',
+            index=models.Index(fields=['user', 'category'], name='expenses_in_user_id_da6e91_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """Enforce unique emails (case-insensitively) at the database level.
+
+    The functional index turns the registration-form email existence check
+    into a unique-index probe and closes the check-then-insert race. Blank
+    emails are excluded since Django allows them on auth_user.
+    """
+
+    dependencies = [
+        ('expenses', '0002_income_expenses_in_user_id_da6e91_idx'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                "CREATE UNIQUE INDEX auth_user_email_lower_uniq "
+                "ON auth_user (LOWER(email)) WHERE email <> ''"
+            ),
+            reverse_sql="DROP INDEX auth_user_email_lower_uniq",
+        ),
+    ]
@@ -0,0 +1,43 @@
+from django.db import migrations, models
+
+
+def backfill_color_rgb(apps, schema_editor):
+    Category = apps.get_model('expenses', 'Category')
+    categories = []
+    for category in Category.objects.all().iterator():
+        try:
+            category.color_rgb = int(category.color.lstrip('#'), 16)
+        except (AttributeError, ValueError):
+            category.color_rgb = 0x6C757D
+        categories.append(category)
+    Category.objects.bulk_update(categories, ['color_rgb'], batch_size=500)
+
+
+def restore_color_hex(apps, schema_editor):
+    Category = apps.get_model('expenses', 'Category')
+    categories = []
+    for category in Category.objects.all().iterator():
+        category.color = f'#{category.color_rgb:06x}'
+        categories.append(category)
+    Category.objects.bulk_update(categories, ['color'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+    """Store Category.color as a 24-bit integer instead of a hex varchar."""
+
+    dependencies = [
+        ('expenses', '0003_auth_user_email_lower_uniq'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='color_rgb',
+            field=models.PositiveIntegerField(default=0x6C757D, help_text='24-bit RGB color'),
+        ),
+        migrations.RunPython(backfill_color_rgb, restore_color_hex),
+        migrations.RemoveField(
+            model_name='category',
+            name='color',
+        ),
+    ]
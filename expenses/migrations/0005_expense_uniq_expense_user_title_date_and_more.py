@@ -0,0 +1,46 @@
+# Generated by Django 5.0.6 on 2026-08-30 06:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def dedup_titles(apps, schema_editor):
+    """Rename duplicate (user, title, date) rows so the constraint can apply.
+
+    Duplicates were legal before this migration; the first row (lowest
+    pk) keeps its title and later ones get a ' (pk)' suffix, which is
+    unique by construction.
+    """
+    for model_name in ('Expense', 'Income'):
+        model = apps.get_model('expenses', model_name)
+        seen = set()
+        renamed = []
+        for row in model.objects.order_by('pk').only('user_id', 'title', 'date').iterator():
+            key = (row.user_id, row.title, row.date)
+            if key in seen:
+                row.title = f'{row.title[:190]} ({row.pk})'
+                renamed.append(row)
+            else:
+                seen.add(key)
+        if renamed:
+            model.objects.bulk_update(renamed, ['title'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('expenses', '0004_category_color_rgb'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(dedup_titles, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='expense',
+            constraint=models.UniqueConstraint(fields=('user', 'title', 'date'), name='uniq_expense_user_title_date'),
+        ),
+        migrations.AddConstraint(
+            model_name='income',
+            constraint=models.UniqueConstraint(fields=('user', 'title', 'date'), name='uniq_income_user_title_date'),
+        ),
+    ]
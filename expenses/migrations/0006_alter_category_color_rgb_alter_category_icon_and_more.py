@@ -0,0 +1,33 @@
+# Generated by Django 5.0.6 on 2026-08-30 06:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('expenses', '0005_expense_uniq_expense_user_title_date_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='category',
+            name='color_rgb',
+            field=models.PositiveIntegerField(db_default=7107965, help_text='24-bit RGB color'),
+        ),
+        migrations.AlterField(
+            model_name='category',
+            name='icon',
+            field=models.CharField(db_default='bi-tag', help_text='Bootstrap icon class', max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='userprofile',
+            name='currency',
+            field=models.CharField(db_default='$', max_length=10),
+        ),
+        migrations.AlterField(
+            model_name='userprofile',
+            name='dark_mode',
+            field=models.BooleanField(db_default=False),
+        ),
+    ]
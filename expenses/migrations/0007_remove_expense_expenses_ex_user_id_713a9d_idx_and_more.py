@@ -0,0 +1,31 @@
+# Generated by Django 5.0.6 on 2026-08-30 06:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('expenses', '0006_alter_category_color_rgb_alter_category_icon_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='expense',
+            name='expenses_ex_user_id_713a9d_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='income',
+            name='expenses_in_user_id_0747df_idx',
+        ),
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['user', 'date'], include=('amount',), name='exp_user_date_amt_cov'),
+        ),
+        migrations.AddIndex(
+            model_name='income',
+            index=models.Index(fields=['user', 'date'], include=('amount',), name='inc_user_date_amt_cov'),
+        ),
+    ]
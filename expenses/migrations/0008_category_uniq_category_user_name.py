@@ -0,0 +1,41 @@
+# Generated by Django 5.0.6 on 2026-08-30 06:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def dedup_names(apps, schema_editor):
+    """Rename duplicate (user, name) categories so the constraint can apply.
+
+    Duplicates were legal before this migration; the first row (lowest
+    pk) keeps its name and later ones get a ' (pk)' suffix, which is
+    unique by construction.
+    """
+    Category = apps.get_model('expenses', 'Category')
+    seen = set()
+    renamed = []
+    for category in Category.objects.order_by('pk').only('user_id', 'name').iterator():
+        key = (category.user_id, category.name)
+        if key in seen:
+            category.name = f'{category.name[:90]} ({category.pk})'
+            renamed.append(category)
+        else:
+            seen.add(key)
+    if renamed:
+        Category.objects.bulk_update(renamed, ['name'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('expenses', '0007_remove_expense_expenses_ex_user_id_713a9d_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(dedup_names, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='category',
+            constraint=models.UniqueConstraint(fields=('user', 'name'), name='uniq_category_user_name'),
+        ),
+    ]
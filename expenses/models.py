@@ -4,10 +4,22 @@ Finance Tracker Models
 Models: UserProfile, Category, Expense, Income
 All user-specific data is filtered by user FK for security.
 """
+import os
+from io import BytesIO
+
+from PIL import Image, ImageOps
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.contrib.auth.models import User
 from django.utils import timezone
 
+AVATAR_MAX_SIZE = (200, 200)
+AVATAR_WEBP_QUALITY = 75
+
 
 class UserProfile(models.Model):
     """Extended user profile with picture and preferences."""
@@ -18,19 +30,54 @@ class UserProfile(models.Model):
         blank=True,
         default=None
     )
-    currency = models.CharField(max_length=10, default='$')
-    dark_mode = models.BooleanField(default=False)
+    currency = models.CharField(max_length=10, db_default='$')
+    dark_mode = models.BooleanField(db_default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
         return f"{self.user.username}'s Profile"
 
+    def save(self, *args, **kwargs):
+        # Downscale fresh uploads once, before they hit storage, so the
+        # profile page serves a small WebP instead of the raw original.
+        picture = self.profile_picture
+        if picture and not picture._committed:
+            self.profile_picture = self._downscaled(picture)
+        super().save(*args, **kwargs)
+
+    @staticmethod
+    def _downscaled(uploaded):
+        """Return the upload resized to fit AVATAR_MAX_SIZE as WebP."""
+        image = ImageOps.exif_transpose(Image.open(uploaded))
+        image.thumbnail(AVATAR_MAX_SIZE)
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGB')
+        buffer = BytesIO()
+        image.save(buffer, format='WEBP', quality=AVATAR_WEBP_QUALITY)
+        name = os.path.splitext(os.path.basename(uploaded.name))[0] + '.webp'
+        return ContentFile(buffer.getvalue(), name=name)
+
     def get_picture_url(self):
         if self.profile_picture:
             return self.profile_picture.url
         return None
 
 
+@receiver(post_save, sender=User)
+def create_user_profile(sender, instance, created, **kwargs):
+    """Ensure every new user gets a profile row."""
+    if created:
+        UserProfile.objects.create(user=instance)
+
+
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+def clear_theme_cache(sender, instance, **kwargs):
+    """Bust the cached theme context when a profile changes."""
+    from .context_processors import theme_cache_key
+    cache.delete(theme_cache_key(instance.user_id))
+
+
 class Category(models.Model):
     """Expense/Income categories, user-specific."""
     CATEGORY_TYPES = [
@@ -41,8 +88,8 @@ class Category(models.Model):
 
     name = models.CharField(max_length=100)
     category_type = models.CharField(max_length=10, choices=CATEGORY_TYPES, default='expense')
-    icon = models.CharField(max_length=50, default='bi-tag', help_text='Bootstrap icon class')
-    color = models.CharField(max_length=7, default='#6c757d', help_text='Hex color code')
+    icon = models.CharField(max_length=50, db_default='bi-tag', help_text='Bootstrap icon class')
+    color_rgb = models.PositiveIntegerField(db_default=0x6C757D, help_text='24-bit RGB color')
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='categories')
     is_default = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -53,10 +100,38 @@ class Category(models.Model):
         indexes = [
             models.Index(fields=['user', 'category_type']),
         ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'name'],
+                name='uniq_category_user_name',
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
+    @property
+    def color(self):
+        """Hex color code for templates, e.g. '#6c757d'.
+
+        Stored as a 24-bit integer (color_rgb) to keep rows narrow;
+        the property keeps the '#rrggbb' interface for templates and
+        forms.
+        """
+        return f'#{self.color_rgb:06x}'
+
+    @color.setter
+    def color(self, value):
+        self.color_rgb = int(value.lstrip('#'), 16)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def clear_category_cache(sender, instance, **kwargs):
+    """Bust the cached per-user category id index when a category changes."""
+    from .forms import category_cache_key
+    cache.delete(category_cache_key(instance.user_id))
+
 
 class Expense(models.Model):
     """Core expense model with full CRUD support."""
@@ -78,9 +153,21 @@ class Expense(models.Model):
     class Meta:
         ordering = ['-date', '-created_at']
         indexes = [
-            models.Index(fields=['user', 'date']),
+            # Covers dashboard SUM(amount) range scans index-only on
+            # PostgreSQL; include= is ignored on backends without support.
+            # A backward scan of the same B-tree also serves the list
+            # views' ORDER BY date DESC pagination, so no separate
+            # (user, -date) index is needed.
+            models.Index(fields=['user', 'date'], include=['amount'],
+                         name='exp_user_date_amt_cov'),
             models.Index(fields=['user', 'category']),
         ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'title', 'date'],
+                name='uniq_expense_user_title_date',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} - ${self.amount}"
@@ -106,8 +193,26 @@ class Income(models.Model):
     class Meta:
         ordering = ['-date', '-created_at']
         indexes = [
-            models.Index(fields=['user', 'date']),
+            models.Index(fields=['user', 'date'], include=['amount'],
+                         name='inc_user_date_amt_cov'),
+            models.Index(fields=['user', 'category']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'title', 'date'],
+                name='uniq_income_user_title_date',
+            ),
         ]
 
     def __str__(self):
         return f"{self.title} - ${self.amount}"
+
+
+@receiver(post_save, sender=Expense)
+@receiver(post_delete, sender=Expense)
+@receiver(post_save, sender=Income)
+@receiver(post_delete, sender=Income)
+def touch_dashboard_cache(sender, instance, **kwargs):
+    """Version the cached dashboard aggregates when transactions change."""
+    from .views import touch_dashboard
+    touch_dashboard(instance.user_id)
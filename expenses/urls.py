@@ -6,11 +6,11 @@ from . import views
 
 urlpatterns = [
     # ─── Public ───────────────────────────────────────────────────────────────
-    path('', views.LandingView.as_view(), name='landing'),
+    path('', views.landing, name='landing'),
 
     # ─── Auth ─────────────────────────────────────────────────────────────────
-    path('register/', views.RegisterView.as_view(), name='register'),
-    path('login/', views.LoginView.as_view(), name='login'),
+    path('register/', views.register, name='register'),
+    path('login/', views.login_view, name='login'),
     path('logout/', views.LogoutView.as_view(), name='logout'),
     path('profile/', views.ProfileView.as_view(), name='profile'),
     path('toggle-dark-mode/', views.ToggleDarkModeView.as_view(), name='toggle_dark_mode'),
@@ -4,7 +4,9 @@ Finance Tracker Views
 Class-Based Views for all features. Every queryset is filtered by request.user.
 """
 import csv
-import json
+import gzip
+import io
+import time
 from datetime import date, timedelta
 from decimal import Decimal
 
@@ -12,15 +14,20 @@ from django.contrib import messages
 from django.contrib.auth import login, logout, authenticate
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.models import User
-from django.db.models import Sum, Q, Count
-from django.db.models.functions import TruncMonth
-from django.http import HttpResponse, JsonResponse
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import CharField, Count, FloatField, Q, Sum, Value
+from django.db.models.functions import Cast, TruncMonth
+from django.http import Http404, JsonResponse, StreamingHttpResponse
 from django.shortcuts import render, redirect, get_object_or_404
 from django.urls import reverse_lazy
 from django.utils import timezone
 from django.views import View
+from django.views.decorators.cache import cache_page
+from django.views.decorators.csrf import csrf_protect
+from django.views.decorators.vary import vary_on_cookie
 from django.views.generic import (
-    ListView, CreateView, UpdateView, DeleteView, DetailView, TemplateView
+    ListView, CreateView, UpdateView, DeleteView, DetailView
 )
 from django.conf import settings
 
@@ -28,11 +35,27 @@ from .forms import (
     UserRegisterForm, UserLoginForm, UserUpdateForm, ProfileUpdateForm,
     CategoryForm, ExpenseForm, IncomeForm, ExpenseFilterForm, DateRangeFilterForm
 )
-from .models import Category, Expense, Income, UserProfile
+from .models import Category, Expense, Income
 
 
 # ─── Helper Functions ─────────────────────────────────────────────────────────
 
+DASHBOARD_CACHE_TIMEOUT = 300  # seconds
+
+
+def dashboard_lastmod_key(user_id):
+    return f'dashmod:{user_id}'
+
+
+def touch_dashboard(user_id):
+    """Record that a user's transactions changed.
+
+    The timestamp is part of the dashboard cache key, so bumping it
+    versions every cached aggregate for the user instead of having to
+    enumerate and delete per-date-range entries."""
+    cache.set(dashboard_lastmod_key(user_id), time.time(), None)
+
+
 DEFAULT_CATEGORIES = [
     # Expense categories
     {'name': 'Food & Dining', 'category_type': 'expense', 'icon': 'bi-cup-hot', 'color': '#e74c3c'},
@@ -50,97 +73,166 @@ DEFAULT_CATEGORIES = [
     {'name': 'Other Income', 'category_type': 'income', 'icon': 'bi-plus-circle', 'color': '#16a085'},
 ]
 
+# Constructor kwargs prepared once at import time; per registration only
+# the user differs.
+_PREPARED_CATEGORIES = tuple({**cat, 'is_default': True} for cat in DEFAULT_CATEGORIES)
 
-def create_default_categories(user):
-    """Create default categories for a new user."""
-    for cat in DEFAULT_CATEGORIES:
-        Category.objects.get_or_create(
-            user=user,
-            name=cat['name'],
-            defaults={**cat, 'is_default': True}
-        )
-
-
-def get_financial_summary(user, date_from=None, date_to=None):
-    """Calculate total income, expenses, and balance for a user."""
-    expenses_qs = Expense.objects.filter(user=user)
-    income_qs = Income.objects.filter(user=user)
 
+def create_default_categories(user):
+    """Create default categories for a new user in one batch insert.
+
+    The (user, name) unique constraint makes ignore_conflicts a no-op
+    for categories the user already has, so this stays idempotent."""
+    Category.objects.bulk_create(
+        [Category(user=user, **cat) for cat in _PREPARED_CATEGORIES],
+        ignore_conflicts=True,
+    )
+
+
+def get_dashboard_payload(user, date_from=None, date_to=None):
+    """Assemble the dashboard's aggregates in as few round-trips as possible.
+
+    One kind-tagged UNION ALL returns both overall totals, a second
+    returns both monthly series, and the pie breakdown shares the same
+    cached entry — three queries cold, none while the cache (versioned
+    by the transaction signals) is warm.
+    """
+    # Plain range lookups (half-open upper bound) so the (user, date)
+    # index is usable — never __date/__year-style extract lookups here.
+    date_filters = {}
     if date_from:
-        expenses_qs = expenses_qs.filter(date__gte=date_from)
-        income_qs = income_qs.filter(date__gte=date_from)
+        date_filters['date__gte'] = date_from
     if date_to:
-        expenses_qs = expenses_qs.filter(date__lte=date_to)
-        income_qs = income_qs.filter(date__lte=date_to)
+        date_filters['date__lt'] = date_to + timedelta(days=1)
+
+    def compute():
+        # Overall totals: one UNION ALL round-trip instead of an
+        # aggregate per model. Sums stay Decimal for the summary cards.
+        expense_total = (
+            Expense.objects.filter(user=user, **date_filters)
+            .values(kind=Value('expense', output_field=CharField()))
+            .annotate(total=Sum('amount'))
+            .order_by()
+        )
+        income_total = (
+            Income.objects.filter(user=user, **date_filters)
+            .values(kind=Value('income', output_field=CharField()))
+            .annotate(total=Sum('amount'))
+            .order_by()
+        )
+        totals = {'expense': Decimal('0'), 'income': Decimal('0')}
+        for row in expense_total.union(income_total, all=True):
+            # SUM over an empty range comes back as NULL.
+            totals[row['kind']] = row['total'] or Decimal('0')
 
-    total_expenses = expenses_qs.aggregate(total=Sum('amount'))['total'] or Decimal('0')
-    total_income = income_qs.aggregate(total=Sum('amount'))['total'] or Decimal('0')
-    balance = total_income - total_expenses
+        # Monthly totals (last 6 months), likewise one UNION ALL
+        # aligned by raw month key in one pass.
+        six_months_ago = date.today() - timedelta(days=180)
+        expense_months = (
+            Expense.objects.filter(user=user, date__gte=six_months_ago)
+            .annotate(month=TruncMonth('date'))
+            .values('month')
+            .annotate(total=Sum(Cast('amount', FloatField())),
+                      kind=Value('expense', output_field=CharField()))
+            .order_by()
+        )
+        income_months = (
+            Income.objects.filter(user=user, date__gte=six_months_ago)
+            .annotate(month=TruncMonth('date'))
+            .values('month')
+            .annotate(total=Sum(Cast('amount', FloatField())),
+                      kind=Value('income', output_field=CharField()))
+            .order_by()
+        )
+        monthly_totals = {}
+        for row in expense_months.union(income_months, all=True).order_by('month'):
+            month_totals = monthly_totals.setdefault(row['month'], {'expense': 0.0, 'income': 0.0})
+            month_totals[row['kind']] = row['total']
+
+        # Category breakdown for pie chart. Sums are cast to float in
+        # SQL (the charts don't need Decimal precision), so the driver
+        # hands back floats with no per-row conversion.
+        category_expenses = (
+            Expense.objects.filter(user=user, **date_filters)
+            .values('category__name', 'category__color_rgb')
+            .annotate(total=Sum(Cast('amount', FloatField())))
+            .order_by('-total')[:8]
+        )
+        return {
+            'total_expenses': totals['expense'],
+            'total_income': totals['income'],
+            'balance': totals['income'] - totals['expense'],
+            'monthly_totals': monthly_totals,
+            'category_expenses': list(category_expenses),
+        }
 
-    return {
-        'total_expenses': total_expenses,
-        'total_income': total_income,
-        'balance': balance,
-        'expenses_qs': expenses_qs,
-        'income_qs': income_qs,
-    }
+    # The aggregates only change when the user records a transaction;
+    # the lastmod timestamp in the key (bumped by the Expense/Income
+    # signals) versions the entry, so stale data is never served
+    # within the TTL.
+    lastmod = cache.get(dashboard_lastmod_key(user.pk), 0)
+    return cache.get_or_set(
+        f'dash:{user.pk}:{date_from}:{date_to}:{lastmod}',
+        compute,
+        DASHBOARD_CACHE_TIMEOUT,
+    )
 
 
 # ─── Public Views ─────────────────────────────────────────────────────────────
 
-class LandingView(TemplateView):
-    """Public landing page. Redirect authenticated users to dashboard."""
-    template_name = 'landing.html'
+@cache_page(60 * 60)
+@vary_on_cookie
+def landing(request):
+    """Public landing page. Redirect authenticated users to dashboard.
 
-    def get(self, request, *args, **kwargs):
-        if request.user.is_authenticated:
-            return redirect('dashboard')
-        return super().get(request, *args, **kwargs)
+    The page is static, so anonymous hits (the common case) are served
+    from the page cache without rendering; Vary: Cookie keeps cached
+    copies from leaking across sessions, and authenticated users get
+    the redirect.
+    """
+    if request.user.is_authenticated:
+        return redirect('dashboard')
+    return render(request, 'landing.html')
 
 
 # ─── Auth Views ───────────────────────────────────────────────────────────────
+# Thin function views: the auth check short-circuits before any CBV
+# dispatch machinery, and these paths carry the bulk of auth traffic.
 
-class RegisterView(View):
+@csrf_protect
+def register(request):
     """User registration. Redirect if already logged in."""
-    template_name = 'registration/register.html'
-
-    def dispatch(self, request, *args, **kwargs):
-        if request.user.is_authenticated:
-            return redirect('dashboard')
-        return super().dispatch(request, *args, **kwargs)
-
-    def get(self, request):
-        form = UserRegisterForm()
-        return render(request, self.template_name, {'form': form})
-
-    def post(self, request):
+    if request.user.is_authenticated:
+        return redirect('dashboard')
+    if request.method == 'POST':
         form = UserRegisterForm(request.POST)
         if form.is_valid():
-            user = form.save()
-            # Create profile
-            UserProfile.objects.create(user=user)
-            # Create default categories
-            create_default_categories(user)
-            login(request, user)
-            messages.success(request, f"Welcome aboard, {user.first_name or user.username}! 🎉 Your account is ready.")
-            return redirect('dashboard')
-        return render(request, self.template_name, {'form': form})
+            try:
+                # One transaction: the user insert, the profile insert
+                # (post_save signal) and the category batch insert
+                # commit together instead of three autocommits.
+                with transaction.atomic():
+                    user = form.save()
+                    create_default_categories(user)
+            except IntegrityError:
+                # The LOWER(email) unique index is the race-free check;
+                # a concurrent registration can still slip past clean_email.
+                form.add_error('email', "An account with this email already exists.")
+            else:
+                login(request, user)
+                messages.success(request, f"Welcome aboard, {user.first_name or user.username}! 🎉 Your account is ready.")
+                return redirect('dashboard')
+    else:
+        form = UserRegisterForm()
+    return render(request, 'registration/register.html', {'form': form})
 
 
-class LoginView(View):
+@csrf_protect
+def login_view(request):
     """User login. Redirect if already logged in."""
-    template_name = 'registration/login.html'
-
-    def dispatch(self, request, *args, **kwargs):
-        if request.user.is_authenticated:
-            return redirect('dashboard')
-        return super().dispatch(request, *args, **kwargs)
-
-    def get(self, request):
-        form = UserLoginForm()
-        return render(request, self.template_name, {'form': form})
-
-    def post(self, request):
+    if request.user.is_authenticated:
+        return redirect('dashboard')
+    if request.method == 'POST':
         form = UserLoginForm(request, data=request.POST)
         if form.is_valid():
             user = form.get_user()
@@ -148,7 +240,9 @@ class LoginView(View):
             messages.success(request, f"Welcome back, {user.first_name or user.username}! 👋")
             next_url = request.GET.get('next', 'dashboard')
             return redirect(next_url)
-        return render(request, self.template_name, {'form': form})
+    else:
+        form = UserLoginForm()
+    return render(request, 'registration/login.html', {'form': form})
 
 
 class LogoutView(LoginRequiredMixin, View):
@@ -165,8 +259,7 @@ class ProfileView(LoginRequiredMixin, View):
 
     def get(self, request):
         user_form = UserUpdateForm(instance=request.user)
-        profile, _ = UserProfile.objects.get_or_create(user=request.user)
-        profile_form = ProfileUpdateForm(instance=profile)
+        profile_form = ProfileUpdateForm(instance=request.profile)
         context = {
             'user_form': user_form,
             'profile_form': profile_form,
@@ -174,9 +267,8 @@ class ProfileView(LoginRequiredMixin, View):
         return render(request, self.template_name, context)
 
     def post(self, request):
-        profile, _ = UserProfile.objects.get_or_create(user=request.user)
         user_form = UserUpdateForm(request.POST, instance=request.user)
-        profile_form = ProfileUpdateForm(request.POST, request.FILES, instance=profile)
+        profile_form = ProfileUpdateForm(request.POST, request.FILES, instance=request.profile)
 
         if user_form.is_valid() and profile_form.is_valid():
             user_form.save()
@@ -191,7 +283,7 @@ class ProfileView(LoginRequiredMixin, View):
 class ToggleDarkModeView(LoginRequiredMixin, View):
     """AJAX toggle dark mode."""
     def post(self, request):
-        profile, _ = UserProfile.objects.get_or_create(user=request.user)
+        profile = request.profile
         profile.dark_mode = not profile.dark_mode
         profile.save()
         return JsonResponse({'dark_mode': profile.dark_mode})
@@ -211,65 +303,84 @@ class DashboardView(LoginRequiredMixin, View):
             date_from = filter_form.cleaned_data.get('date_from')
             date_to = filter_form.cleaned_data.get('date_to')
 
-        summary = get_financial_summary(request.user, date_from, date_to)
-
-        # Recent transactions (last 5)
-        recent_expenses = Expense.objects.filter(user=request.user).select_related('category')[:5]
-        recent_income = Income.objects.filter(user=request.user).select_related('category')[:5]
-
-        # Monthly expense summary (last 6 months)
-        six_months_ago = date.today() - timedelta(days=180)
-        monthly_expenses = (
-            Expense.objects.filter(user=request.user, date__gte=six_months_ago)
-            .annotate(month=TruncMonth('date'))
-            .values('month')
-            .annotate(total=Sum('amount'))
-            .order_by('month')
+        payload = get_dashboard_payload(request.user, date_from, date_to)
+
+        # Recent transactions: one UNION ALL round-trip fetches the five
+        # newest of each model, split back into the two panel lists by
+        # kind. The per-kind LIMIT lives in an id subquery (legal on
+        # every backend) since SQLite rejects sliced compound members,
+        # so neither panel can be starved by a burst of the other kind.
+        recent_fields = ('title', 'amount', 'date', 'created_at',
+                         'category__name', 'category__icon', 'category__color_rgb')
+        recent_expense_ids = (
+            Expense.objects.filter(user=request.user)
+            .order_by('-date', '-created_at')
+            .values('pk')[:5]
         )
-        monthly_income = (
-            Income.objects.filter(user=request.user, date__gte=six_months_ago)
-            .annotate(month=TruncMonth('date'))
-            .values('month')
-            .annotate(total=Sum('amount'))
-            .order_by('month')
+        recent_income_ids = (
+            Income.objects.filter(user=request.user)
+            .order_by('-date', '-created_at')
+            .values('pk')[:5]
         )
-
-        # Category breakdown for pie chart
-        category_expenses = (
-            summary['expenses_qs']
-            .values('category__name', 'category__color')
-            .annotate(total=Sum('amount'))
-            .order_by('-total')[:8]
+        recent_expense_rows = (
+            Expense.objects.filter(pk__in=recent_expense_ids)
+            .annotate(kind=Value('expense', output_field=CharField()))
+            .values(*recent_fields, 'kind')
+            .order_by()
         )
-
-        # Chart data serialization
-        chart_labels = [item['month'].strftime('%b %Y') for item in monthly_expenses]
-        chart_expense_data = [float(item['total']) for item in monthly_expenses]
+        recent_income_rows = (
+            Income.objects.filter(pk__in=recent_income_ids)
+            .annotate(kind=Value('income', output_field=CharField()))
+            .values(*recent_fields, 'kind')
+            .order_by()
+        )
+        recent_expenses, recent_income = [], []
+        recent = recent_expense_rows.union(recent_income_rows, all=True).order_by('-date', '-created_at')
+        for row in recent:
+            # Nested dict mirrors the model's category attribute access
+            # (category.name/.icon/.color) so the template is unchanged.
+            row['category'] = {
+                'name': row['category__name'],
+                'icon': row['category__icon'],
+                'color': f"#{row['category__color_rgb']:06x}",
+            } if row['category__name'] is not None else None
+            (recent_expenses if row.pop('kind') == 'expense' else recent_income).append(row)
+
+        monthly_totals = payload['monthly_totals']
+        category_expenses = payload['category_expenses']
+
+        # Chart data serialization: single pass over the month-keyed
+        # dict, formatting each month label exactly once at emit time.
+        chart_labels = []
+        chart_expense_data = []
         chart_income_data = []
-        for label in chart_labels:
-            match = next(
-                (float(i['total']) for i in monthly_income if i['month'].strftime('%b %Y') == label),
-                0
-            )
-            chart_income_data.append(match)
+        for month, totals in monthly_totals.items():
+            chart_labels.append(month.strftime('%b %Y'))
+            chart_expense_data.append(totals['expense'])
+            chart_income_data.append(totals['income'])
 
         pie_labels = [item['category__name'] or 'Uncategorized' for item in category_expenses]
-        pie_data = [float(item['total']) for item in category_expenses]
-        pie_colors = [item['category__color'] or '#6c757d' for item in category_expenses]
+        pie_data = [item['total'] for item in category_expenses]
+        pie_colors = [
+            f"#{item['category__color_rgb']:06x}" if item['category__color_rgb'] is not None else '#6c757d'
+            for item in category_expenses
+        ]
 
         context = {
             'filter_form': filter_form,
-            'total_income': summary['total_income'],
-            'total_expenses': summary['total_expenses'],
-            'balance': summary['balance'],
+            'total_income': payload['total_income'],
+            'total_expenses': payload['total_expenses'],
+            'balance': payload['balance'],
             'recent_expenses': recent_expenses,
             'recent_income': recent_income,
-            'chart_labels': json.dumps(chart_labels),
-            'chart_expense_data': json.dumps(chart_expense_data),
-            'chart_income_data': json.dumps(chart_income_data),
-            'pie_labels': json.dumps(pie_labels),
-            'pie_data': json.dumps(pie_data),
-            'pie_colors': json.dumps(pie_colors),
+            # Raw lists; the template serializes them once via
+            # json_script, which also HTML-escapes safely.
+            'chart_labels': chart_labels,
+            'chart_expense_data': chart_expense_data,
+            'chart_income_data': chart_income_data,
+            'pie_labels': pie_labels,
+            'pie_data': pie_data,
+            'pie_colors': pie_colors,
             'date_from': date_from,
             'date_to': date_to,
         }
@@ -285,32 +396,46 @@ class ExpenseListView(LoginRequiredMixin, ListView):
     context_object_name = 'expenses'
     paginate_by = getattr(settings, 'EXPENSES_PER_PAGE', 10)
 
+    def setup(self, request, *args, **kwargs):
+        super().setup(request, *args, **kwargs)
+        # Bind and validate the filter form once per request;
+        # get_queryset and get_context_data both reuse it. (Anonymous
+        # requests are bounced by LoginRequiredMixin before use.)
+        self.filter_form = None
+        if request.user.is_authenticated:
+            self.filter_form = ExpenseFilterForm(request.GET, user=request.user)
+            self.filter_form.is_valid()
+
     def get_queryset(self):
         qs = Expense.objects.filter(user=self.request.user).select_related('category')
-        form = ExpenseFilterForm(self.request.GET, user=self.request.user)
+        form = self.filter_form
 
         if form.is_valid():
-            if form.cleaned_data.get('search'):
-                qs = qs.filter(
-                    Q(title__icontains=form.cleaned_data['search']) |
-                    Q(description__icontains=form.cleaned_data['search'])
-                )
-            if form.cleaned_data.get('category'):
-                qs = qs.filter(category=form.cleaned_data['category'])
-            if form.cleaned_data.get('date_from'):
-                qs = qs.filter(date__gte=form.cleaned_data['date_from'])
-            if form.cleaned_data.get('date_to'):
-                qs = qs.filter(date__lte=form.cleaned_data['date_to'])
-            if form.cleaned_data.get('amount_min') is not None:
-                qs = qs.filter(amount__gte=form.cleaned_data['amount_min'])
-            if form.cleaned_data.get('amount_max') is not None:
-                qs = qs.filter(amount__lte=form.cleaned_data['amount_max'])
+            # Combine every active filter into one Q so a single
+            # filter() call (one queryset clone) replaces up to five.
+            data = form.cleaned_data
+            q = Q()
+            if data.get('search'):
+                q &= Q(title__icontains=data['search']) | Q(description__icontains=data['search'])
+            if data.get('category'):
+                q &= Q(category=data['category'])
+            if form.filters:
+                q &= Q(**form.filters)
+            if data.get('amount_min') is not None:
+                q &= Q(amount__gte=data['amount_min'])
+            if data.get('amount_max') is not None:
+                q &= Q(amount__lte=data['amount_max'])
+            if q:
+                qs = qs.filter(q)
         return qs
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['filter_form'] = ExpenseFilterForm(self.request.GET, user=self.request.user)
-        context['total_filtered'] = self.get_queryset().aggregate(total=Sum('amount'))['total'] or 0
+        context['filter_form'] = self.filter_form
+        # Aggregate over the filtered queryset the base class already
+        # built, instead of re-running the whole filter pipeline.
+        qs = context['paginator'].object_list if context.get('paginator') else context['object_list']
+        context['total_filtered'] = qs.aggregate(total=Sum('amount'))['total'] or 0
         return context
 
 
@@ -327,7 +452,12 @@ class ExpenseCreateView(LoginRequiredMixin, View):
         if form.is_valid():
             expense = form.save(commit=False)
             expense.user = request.user
-            expense.save()
+            try:
+                expense.save()
+            except IntegrityError:
+                # (user, title, date) unique constraint
+                form.add_error('title', "An expense with this title and date already exists.")
+                return render(request, self.template_name, {'form': form, 'title': 'Add Expense'})
             messages.success(request, f"Expense '{expense.title}' added successfully! 💸")
             return redirect('expense_list')
         return render(request, self.template_name, {'form': form, 'title': 'Add Expense'})
@@ -349,7 +479,12 @@ class ExpenseUpdateView(LoginRequiredMixin, View):
         expense = self.get_object(request, pk)
         form = ExpenseForm(request.POST, instance=expense, user=request.user)
         if form.is_valid():
-            form.save()
+            try:
+                form.save()
+            except IntegrityError:
+                # (user, title, date) unique constraint
+                form.add_error('title', "An expense with this title and date already exists.")
+                return render(request, self.template_name, {'form': form, 'title': 'Edit Expense', 'object': expense})
             messages.success(request, f"Expense updated successfully! ✅")
             return redirect('expense_list')
         return render(request, self.template_name, {'form': form, 'title': 'Edit Expense', 'object': expense})
@@ -358,9 +493,14 @@ class ExpenseUpdateView(LoginRequiredMixin, View):
 class ExpenseDeleteView(LoginRequiredMixin, View):
     """Delete expense via AJAX or normal POST."""
     def post(self, request, pk):
-        expense = get_object_or_404(Expense, pk=pk, user=request.user)
-        title = expense.title
-        expense.delete()
+        # Fetch only the title for the message, then delete by queryset:
+        # no instance hydration and one round-trip fewer than
+        # get_object_or_404 plus instance delete.
+        qs = Expense.objects.filter(pk=pk, user=request.user)
+        title = qs.values_list('title', flat=True).first()
+        if title is None:
+            raise Http404("No expense matches the given query.")
+        qs.delete()
 
         if request.headers.get('x-requested-with') == 'XMLHttpRequest':
             return JsonResponse({'success': True, 'message': f"'{title}' deleted."})
@@ -400,7 +540,12 @@ class IncomeCreateView(LoginRequiredMixin, View):
         if form.is_valid():
             income = form.save(commit=False)
             income.user = request.user
-            income.save()
+            try:
+                income.save()
+            except IntegrityError:
+                # (user, title, date) unique constraint
+                form.add_error('title', "An income with this title and date already exists.")
+                return render(request, self.template_name, {'form': form, 'title': 'Add Income'})
             messages.success(request, f"Income '{income.title}' added! 💰")
             return redirect('income_list')
         return render(request, self.template_name, {'form': form, 'title': 'Add Income'})
@@ -422,7 +567,12 @@ class IncomeUpdateView(LoginRequiredMixin, View):
         income = self.get_object(request, pk)
         form = IncomeForm(request.POST, instance=income, user=request.user)
         if form.is_valid():
-            form.save()
+            try:
+                form.save()
+            except IntegrityError:
+                # (user, title, date) unique constraint
+                form.add_error('title', "An income with this title and date already exists.")
+                return render(request, self.template_name, {'form': form, 'title': 'Edit Income', 'object': income})
             messages.success(request, "Income updated successfully! ✅")
             return redirect('income_list')
         return render(request, self.template_name, {'form': form, 'title': 'Edit Income', 'object': income})
@@ -431,9 +581,11 @@ class IncomeUpdateView(LoginRequiredMixin, View):
 class IncomeDeleteView(LoginRequiredMixin, View):
     """Delete income record."""
     def post(self, request, pk):
-        income = get_object_or_404(Income, pk=pk, user=request.user)
-        title = income.title
-        income.delete()
+        qs = Income.objects.filter(pk=pk, user=request.user)
+        title = qs.values_list('title', flat=True).first()
+        if title is None:
+            raise Http404("No income matches the given query.")
+        qs.delete()
         if request.headers.get('x-requested-with') == 'XMLHttpRequest':
             return JsonResponse({'success': True, 'message': f"'{title}' deleted."})
         messages.success(request, f"Income '{title}' deleted.")
@@ -465,7 +617,12 @@ class CategoryCreateView(LoginRequiredMixin, View):
         if form.is_valid():
             category = form.save(commit=False)
             category.user = request.user
-            category.save()
+            try:
+                category.save()
+            except IntegrityError:
+                # (user, name) unique constraint
+                form.add_error('name', "You already have a category with this name.")
+                return render(request, self.template_name, {'form': form, 'title': 'Add Category'})
             messages.success(request, f"Category '{category.name}' created! 🏷️")
             return redirect('category_list')
         return render(request, self.template_name, {'form': form, 'title': 'Add Category'})
@@ -487,7 +644,12 @@ class CategoryUpdateView(LoginRequiredMixin, View):
         category = self.get_object(request, pk)
         form = CategoryForm(request.POST, instance=category)
         if form.is_valid():
-            form.save()
+            try:
+                form.save()
+            except IntegrityError:
+                # (user, name) unique constraint
+                form.add_error('name', "You already have a category with this name.")
+                return render(request, self.template_name, {'form': form, 'title': 'Edit Category', 'object': category})
             messages.success(request, "Category updated! ✅")
             return redirect('category_list')
         return render(request, self.template_name, {'form': form, 'title': 'Edit Category', 'object': category})
@@ -496,57 +658,137 @@ class CategoryUpdateView(LoginRequiredMixin, View):
 class CategoryDeleteView(LoginRequiredMixin, View):
     """Delete a category."""
     def post(self, request, pk):
-        category = get_object_or_404(Category, pk=pk, user=request.user)
-        name = category.name
-        category.delete()
+        qs = Category.objects.filter(pk=pk, user=request.user)
+        name = qs.values_list('name', flat=True).first()
+        if name is None:
+            raise Http404("No category matches the given query.")
+        qs.delete()
         messages.success(request, f"Category '{name}' deleted.")
         return redirect('category_list')
 
 
 # ─── Export ───────────────────────────────────────────────────────────────────
 
+CSV_EXPORT_HEADER = ['Title', 'Amount', 'Category', 'Date', 'Description', 'Created At']
+CSV_EXPORT_CHUNK_SIZE = 2000
+# Exactly the columns the CSV emits, in CSV_EXPORT_HEADER order — keeps
+# unused fields (updated_at, the joined category's icon/color) out of
+# the rows pulled from the DB.
+CSV_EXPORT_FIELDS = ('title', 'amount', 'category__name', 'date', 'description', 'created_at')
+
+
+# Rows formatted per output chunk; amortizes WSGI chunk sends.
+CSV_EXPORT_BATCH_ROWS = 500
+
+
+def csv_stream(rows):
+    """Yield CSV text chunks for an iterable of row lists.
+
+    Rows are formatted into one reusable StringIO — drained with
+    seek/truncate instead of reallocated — and yielded a batch at a
+    time, so allocation churn and per-chunk send overhead stay low
+    while memory remains bounded by the batch size.
+    """
+    text = io.StringIO()
+    writer = csv.writer(text)
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending == CSV_EXPORT_BATCH_ROWS:
+            yield text.getvalue()
+            text.seek(0)
+            text.truncate()
+            pending = 0
+    if pending:
+        yield text.getvalue()
+
+
+def gzip_stream(chunks):
+    """Compress an iterable of text chunks to a gzip byte stream.
+
+    The byte buffer is drained and reused per chunk, so memory stays
+    bounded while repeated dates and category names compress away on
+    the wire.
+    """
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode='wb') as gz:
+        for chunk in chunks:
+            gz.write(chunk.encode('utf-8'))
+            if buffer.tell():
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def csv_export_response(request, rows, filename):
+    """Build the streaming CSV response both export views share.
+
+    Compression is transparent transfer encoding, so it is only applied
+    when the client advertises gzip support, and the attachment keeps
+    its plain .csv name — browsers decode the body before saving.
+    """
+    chunks = csv_stream(rows)
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        response = StreamingHttpResponse(gzip_stream(chunks), content_type='text/csv')
+        response['Content-Encoding'] = 'gzip'
+    else:
+        response = StreamingHttpResponse(chunks, content_type='text/csv')
+    response['Vary'] = 'Accept-Encoding'
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
 class ExportExpensesCSVView(LoginRequiredMixin, View):
-    """Export user expenses to CSV file."""
+    """Export user expenses to CSV, streamed row by row."""
     def get(self, request):
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename="expenses.csv"'
+        expenses = (
+            Expense.objects.filter(user=request.user)
+            .values_list(*CSV_EXPORT_FIELDS)
+            .iterator(chunk_size=CSV_EXPORT_CHUNK_SIZE)
+        )
 
-        writer = csv.writer(response)
-        writer.writerow(['Title', 'Amount', 'Category', 'Date', 'Description', 'Created At'])
+        def rows():
+            yield CSV_EXPORT_HEADER
+            # Raw tuples: no Expense/Category instantiation per row.
+            for title, amount, category, day, description, created_at in expenses:
+                yield [
+                    title,
+                    amount,
+                    category or '',
+                    day,
+                    description or '',
+                    created_at.strftime('%Y-%m-%d %H:%M'),
+                ]
 
-        expenses = Expense.objects.filter(user=request.user).select_related('category')
-        for expense in expenses:
-            writer.writerow([
-                expense.title,
-                expense.amount,
-                expense.category.name if expense.category else '',
-                expense.date,
-                expense.description or '',
-                expense.created_at.strftime('%Y-%m-%d %H:%M'),
-            ])
-        return response
+        return csv_export_response(request, rows(), 'expenses.csv')
 
 
 class ExportIncomeCSVView(LoginRequiredMixin, View):
-    """Export user income to CSV file."""
+    """Export user income to CSV, streamed row by row."""
     def get(self, request):
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename="income.csv"'
-
-        writer = csv.writer(response)
-        writer.writerow(['Title', 'Amount', 'Category', 'Date', 'Description', 'Created At'])
-
-        incomes = Income.objects.filter(user=request.user).select_related('category')
-        for income in incomes:
-            writer.writerow([
-                income.title,
-                income.amount,
-                income.category.name if income.category else '',
-                income.date,
-                income.description or '',
-                income.created_at.strftime('%Y-%m-%d %H:%M'),
-            ])
-        return response
+        incomes = (
+            Income.objects.filter(user=request.user)
+            .values_list(*CSV_EXPORT_FIELDS)
+            .iterator(chunk_size=CSV_EXPORT_CHUNK_SIZE)
+        )
+
+        def rows():
+            yield CSV_EXPORT_HEADER
+            # Raw tuples: no Income/Category instantiation per row.
+            for title, amount, category, day, description, created_at in incomes:
+                yield [
+                    title,
+                    amount,
+                    category or '',
+                    day,
+                    description or '',
+                    created_at.strftime('%Y-%m-%d %H:%M'),
+                ]
+
+        return csv_export_response(request, rows(), 'income.csv')
 
 
 # ─── Error Handlers ───────────────────────────────────────────────────────────